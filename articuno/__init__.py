@@ -1,15 +1,23 @@
 # articuno/__init__.py
 
 from .inference import df_to_pydantic, infer_pydantic_model
-from .codegen import generate_class_code
+from .codegen import generate_class_code, generate_models_code
 from .iterable_infer import dicts_to_pydantic, infer_generic_model
+from .drift import SchemaDrift, monitor_drift
+from .partitioned import infer_partitioned_model
+from .export import df_to_json
 
 __all__ = [
+    "df_to_json",
     "df_to_pydantic",
     "generate_class_code",
+    "generate_models_code",
     "infer_pydantic_model",
     "dicts_to_pydantic",
     "infer_generic_model",
+    "infer_partitioned_model",
+    "monitor_drift",
+    "SchemaDrift",
 ]
 
 __version__ = "0.8.0"
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+Arrow type model inference utilities for Articuno.
+
+Provides helpers to map PyArrow data types to Python/Pydantic types using
+only type metadata, including nested models built from Arrow struct types.
+Shared by pandas_infer for Arrow-backed columns and by schema-only reads of
+Parquet files.
+"""
+
+import datetime
+import decimal
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from pydantic import AwareDatetime, BaseModel, create_model
+
+
+def _arrow_type_to_python(
+    arrow_type: Any,
+    field_name: str,
+    force_optional: bool = False,
+) -> Any:
+    """
+    Map a PyArrow data type to the equivalent Python type.
+
+    Parameters
+    ----------
+    arrow_type : pyarrow.DataType
+        Arrow type to convert.
+    field_name : str
+        Name of the field, used to name nested model classes.
+    force_optional : bool, optional
+        If True, all fields of nested struct models will be Optional.
+
+    Returns
+    -------
+    Any
+        The inferred Python type, or ``Any`` if the Arrow type is not supported.
+    """
+    import pyarrow as pa  # type: ignore
+
+    types = pa.types
+    if types.is_dictionary(arrow_type):
+        return _arrow_type_to_python(arrow_type.value_type, field_name, force_optional)
+    if types.is_boolean(arrow_type):
+        return bool
+    if types.is_integer(arrow_type):
+        return int
+    if types.is_floating(arrow_type):
+        return float
+    if types.is_decimal(arrow_type):
+        return decimal.Decimal
+    if types.is_string(arrow_type) or types.is_large_string(arrow_type):
+        return str
+    if types.is_binary(arrow_type) or types.is_large_binary(arrow_type) \
+       or types.is_fixed_size_binary(arrow_type):
+        return bytes
+    if types.is_timestamp(arrow_type):
+        return AwareDatetime if arrow_type.tz is not None else datetime.datetime
+    if types.is_date(arrow_type):
+        return datetime.date
+    if types.is_time(arrow_type):
+        return datetime.time
+    if types.is_duration(arrow_type):
+        return datetime.timedelta
+    if types.is_list(arrow_type) or types.is_large_list(arrow_type) \
+       or types.is_fixed_size_list(arrow_type):
+        inner = _arrow_type_to_python(arrow_type.value_type, field_name, force_optional)
+        if arrow_type.value_field.nullable:
+            inner = Optional[inner]
+        return List[inner]
+    if types.is_map(arrow_type):
+        key = _arrow_type_to_python(arrow_type.key_type, field_name, force_optional)
+        value = _arrow_type_to_python(arrow_type.item_type, field_name, force_optional)
+        if arrow_type.item_field.nullable:
+            value = Optional[value]
+        return Dict[key, value]
+    if types.is_struct(arrow_type):
+        return _infer_struct_model(arrow_type, field_name, force_optional=force_optional)
+    return Any
+
+
+def _arrow_fields_to_pydantic(
+    arrow_fields: Iterable[Any],
+    name_prefix: str,
+    force_optional: bool = False,
+) -> Dict[str, tuple]:
+    """
+    Build ``create_model`` field definitions from PyArrow fields.
+
+    Parameters
+    ----------
+    arrow_fields : Iterable[pyarrow.Field]
+        Child fields of a struct type or the fields of a schema.
+    name_prefix : str
+        Prefix prepended to field names when naming nested model classes.
+    force_optional : bool, optional
+        If True, all fields will be Optional.
+
+    Returns
+    -------
+    Dict[str, tuple]
+        Mapping of field name to ``(type, default)``.
+    """
+    fields: Dict[str, tuple] = {}
+    for child in arrow_fields:
+        typ = _arrow_type_to_python(child.type, f"{name_prefix}{child.name}", force_optional)
+
+        # Arrow records nullability per child field
+        if force_optional or child.nullable:
+            typ = Optional[typ]
+            default = None
+        else:
+            default = ...
+
+        fields[child.name] = (typ, default)
+    return fields
+
+
+def _infer_struct_model(
+    struct_type: Any,
+    field_name: str,
+    force_optional: bool = False,
+) -> Any:
+    """
+    Create a nested Pydantic model from a PyArrow struct type.
+
+    Parameters
+    ----------
+    struct_type : pyarrow.StructType
+        Struct type whose child fields define the nested model.
+    field_name : str
+        Name of the parent field, used to name the nested model class.
+    force_optional : bool, optional
+        If True, all nested fields will be Optional.
+
+    Returns
+    -------
+    Any
+        A dynamically created nested Pydantic model class for the struct column.
+    """
+    children = [struct_type.field(i) for i in range(struct_type.num_fields)]
+    fields = _arrow_fields_to_pydantic(children, f"{field_name}_", force_optional=force_optional)
+    return create_model(f"{field_name}_NestedModel", **fields)
+
+
+def _infer_schema_model(
+    schema: Any,
+    model_name: str,
+    force_optional: bool = False,
+) -> Type[BaseModel]:
+    """
+    Create a Pydantic model from a PyArrow schema without reading any rows.
+
+    Parameters
+    ----------
+    schema : pyarrow.Schema
+        Schema whose fields define the model.
+    model_name : str
+        Name of the generated Pydantic model class.
+    force_optional : bool, optional
+        If True, all fields will be Optional.
+
+    Returns
+    -------
+    Type[BaseModel]
+        Dynamically created Pydantic model class.
+    """
+    fields = _arrow_fields_to_pydantic(schema, "", force_optional=force_optional)
+    return create_model(model_name, **fields)
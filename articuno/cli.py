@@ -0,0 +1,309 @@
+"""
+Command-line interface for Articuno.
+
+Infers Pydantic models from many data files (Parquet, CSV, NDJSON, JSON) in
+parallel worker processes and writes them into one generated module. Parquet
+files are inferred from their footer schema without reading rows. Inputs are
+fingerprinted by content in a JSON cache together with their inferred schema
+specs, so an unchanged set of inputs skips code generation entirely and only
+files whose content changed are inferred again.
+
+Example::
+
+    articuno "warehouse/**/*.parquet" events.ndjson -o models.py -j 8
+"""
+
+import argparse
+import functools
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from articuno.codegen import generate_models_code
+from articuno.partitioned import _infer_partition_spec
+from articuno.schema_merge import (
+    ModelSpec, _merge_specs, _model_spec_from_json, _model_spec_to_json, _spec_to_model,
+)
+
+CACHE_VERSION = 3
+SUPPORTED_SUFFIXES = (".parquet", ".csv", ".ndjson", ".jsonl", ".json")
+
+
+def _expand_sources(patterns: Sequence[str]) -> List[Path]:
+    """
+    Expand file paths and glob patterns into a sorted list of unique files.
+
+    Parameters
+    ----------
+    patterns : Sequence[str]
+        File paths or glob patterns (``**`` is supported).
+
+    Returns
+    -------
+    List[Path]
+        Resolved file paths. Glob matches are limited to supported file types.
+
+    Raises
+    ------
+    ValueError
+        If a pattern matches no files.
+    """
+    paths: Dict[str, Path] = {}
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = [
+                Path(match) for match in glob.glob(pattern, recursive=True)
+                if Path(match).suffix.lower() in SUPPORTED_SUFFIXES and Path(match).is_file()
+            ]
+        else:
+            matches = [Path(pattern)] if Path(pattern).is_file() else []
+        if not matches:
+            raise ValueError(f"No input files match: {pattern}")
+        for match in matches:
+            paths[str(match.resolve())] = match.resolve()
+    return [paths[key] for key in sorted(paths)]
+
+
+def _model_name_for(path: Path) -> str:
+    """
+    Derive a CamelCase model class name from a file name.
+    """
+    parts = [part for part in re.split(r"[^0-9a-zA-Z]+", path.stem) if part]
+    name = "".join(part[0].upper() + part[1:] for part in parts) or "Model"
+    return f"Model{name}" if name[0].isdigit() else name
+
+
+def _file_digest(path: Path) -> str:
+    """
+    Compute a content fingerprint of a file.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _run_parallel(func: Any, items: List[Any], jobs: Optional[int]) -> List[Any]:
+    """
+    Map `func` over `items` in worker processes, or inline for a single worker.
+    """
+    workers = min(jobs or os.cpu_count() or 1, len(items))
+    if workers <= 1:
+        return list(map(func, items))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _load_cache(path: Optional[Path]) -> Dict[str, Any]:
+    """
+    Load the JSON fingerprint cache, returning an empty cache if missing or unreadable.
+
+    The cache holds file paths, sizes, mtimes, content digests and inferred
+    schema specs. It is never executed: specs are decoded against a whitelist
+    of type names, and entries that fail to decode are inferred again.
+    """
+    if path is not None and path.is_file():
+        try:
+            cache = json.loads(path.read_text(encoding="utf-8"))
+            if isinstance(cache, dict) and cache.get("version") == CACHE_VERSION \
+               and isinstance(cache.get("files"), dict):
+                return cache
+        except (OSError, ValueError):
+            pass
+    return {"version": CACHE_VERSION, "files": {}}
+
+
+def _save_cache(path: Optional[Path], cache: Dict[str, Any]) -> None:
+    """
+    Write the JSON fingerprint cache, if caching is enabled.
+    """
+    if path is not None:
+        path.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the ``articuno`` command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="articuno",
+        description=(
+            "Infer Pydantic models from data files in parallel and generate "
+            "one Python module with their class code."
+        ),
+    )
+    parser.add_argument(
+        "sources", nargs="+",
+        help="Data files or glob patterns (.parquet, .csv, .ndjson/.jsonl, .json).",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="Path of the generated module. Prints to stdout if omitted.",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Number of worker processes (default: number of CPUs).",
+    )
+    parser.add_argument(
+        "--max-scan", type=int, default=1000,
+        help="Maximum records to scan per CSV/JSON file (default: 1000).",
+    )
+    parser.add_argument(
+        "--force-optional", action="store_true",
+        help="Make all fields Optional.",
+    )
+    parser.add_argument(
+        "--merge", metavar="MODEL_NAME",
+        help="Treat all sources as partitions of a single model with this name.",
+    )
+    parser.add_argument(
+        "--root-name", default="Models",
+        help="Name of the root union model in the generated module (default: Models).",
+    )
+    parser.add_argument(
+        "--cache",
+        help="Fingerprint cache file (default: <output>.articuno-cache).",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Always infer every source and regenerate the module.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the ``articuno`` command-line interface.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        Command-line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Process exit code.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        paths = _expand_sources(args.sources)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    cache_path: Optional[Path] = None
+    if not args.no_cache and (args.cache or args.output):
+        cache_path = Path(args.cache or f"{args.output}.articuno-cache")
+    cache = _load_cache(cache_path)
+    entries: Dict[str, Any] = cache["files"]
+
+    try:
+        # Stat fast path: unchanged size and mtime reuse the cached digest
+        digests: Dict[str, str] = {}
+        stale: List[Path] = []
+        for path in paths:
+            stat = path.stat()
+            entry = entries.get(str(path))
+            if isinstance(entry, dict) and entry.get("size") == stat.st_size \
+               and entry.get("mtime_ns") == stat.st_mtime_ns:
+                digests[str(path)] = entry["digest"]
+            else:
+                stale.append(path)
+        for path, digest in zip(stale, _run_parallel(_file_digest, stale, args.jobs)):
+            stat = path.stat()
+            entry = entries.get(str(path))
+            if not isinstance(entry, dict) or entry.get("digest") != digest:
+                entry = {}
+            # A touched but unchanged file keeps its cached spec
+            entries[str(path)] = {
+                **entry, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest,
+            }
+            digests[str(path)] = digest
+
+        output_key = hashlib.blake2b(
+            repr((
+                args.force_optional, args.max_scan, args.merge, args.root_name,
+                sorted(digests.items()),
+            )).encode(),
+            digest_size=16,
+        ).hexdigest()
+        # Without an output file there is nothing to keep up to date
+        if args.output and cache_path is not None \
+           and cache.get("output_key") == output_key and Path(args.output).is_file():
+            _save_cache(cache_path, cache)
+            print(f"articuno: {args.output} is up to date", file=sys.stderr)
+            return 0
+
+        # Reuse cached specs inferred from the same content and options
+        specs: Dict[str, ModelSpec] = {}
+        for path in paths:
+            entry = entries[str(path)]
+            spec_key = [entry["digest"], args.force_optional, args.max_scan]
+            if entry.get("spec_key") == spec_key:
+                try:
+                    specs[str(path)] = _model_spec_from_json(entry.get("spec"))
+                except ValueError:
+                    pass
+        pending = [path for path in paths if str(path) not in specs]
+
+        infer = functools.partial(
+            _infer_partition_spec,
+            loader=None,
+            force_optional=args.force_optional,
+            max_scan=args.max_scan,
+        )
+        for path, spec in zip(pending, _run_parallel(infer, pending, args.jobs)):
+            specs[str(path)] = spec
+            entry = entries[str(path)]
+            entry.pop("spec", None)
+            try:
+                entry["spec"] = _model_spec_to_json(spec)
+                entry["spec_key"] = [entry["digest"], args.force_optional, args.max_scan]
+            except ValueError:
+                # Types outside the JSON whitelist are inferred again next time
+                entry.pop("spec_key", None)
+    except (ValueError, OSError, ImportError) as exc:
+        # ImportError: e.g. Parquet inputs without pyarrow installed
+        print(f"articuno: error: {exc}", file=sys.stderr)
+        return 1
+
+    if args.merge:
+        merged = functools.reduce(_merge_specs, (specs[str(path)] for path in paths))
+        models = [_spec_to_model(
+            merged, args.merge,
+            force_optional=args.force_optional, name_prefix=f"{args.merge}_",
+        )]
+    else:
+        models = []
+        seen: Dict[str, int] = {}
+        for path in paths:
+            spec = specs[str(path)]
+            name = _model_name_for(path)
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                name = f"{name}{seen[name]}"
+            models.append(_spec_to_model(
+                spec, name,
+                force_optional=args.force_optional, name_prefix=f"{name}_",
+            ))
+
+    code = generate_models_code(models, output_path=args.output, root_name=args.root_name)
+    if not args.output:
+        sys.stdout.write(code)
+
+    cache["output_key"] = output_key
+    _save_cache(cache_path, cache)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
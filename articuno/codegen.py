@@ -8,10 +8,11 @@ and generate equivalent Python code using the powerful `datamodel-code-generator
 import json
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple, Union, Type
+from typing import List, Optional, Tuple, Union, Type
 
 from datamodel_code_generator import InputFileType, generate
 from pydantic import BaseModel
+from pydantic.json_schema import models_json_schema
 
 
 def _write_json_schema_to_tempfile(schema: dict) -> Tuple[Path, tempfile.TemporaryDirectory]:
@@ -112,3 +113,45 @@ def generate_class_code(
         return Path(output_path).read_text(encoding="utf-8")
     else:
         return _run_datamodel_codegen(schema_path)
+
+
+def generate_models_code(
+    models: List[Type[BaseModel]],
+    output_path: Optional[Union[str, Path]] = None,
+    root_name: str = "Models",
+) -> str:
+    """
+    Generate one Python module containing class code for several Pydantic models.
+
+    The models are combined into a single JSON schema whose root is a union of
+    all models, so the generated module also contains a `root_name` root model.
+
+    Parameters
+    ----------
+    models : List[Type[BaseModel]]
+        Pydantic model classes to convert to source code. Model names must be unique.
+    output_path : Union[str, Path], optional
+        If provided, the code will be written to this file path.
+    root_name : str, default "Models"
+        Name of the root union model in the generated module.
+
+    Returns
+    -------
+    str
+        The generated Python class code as a string.
+    """
+    refs, schema = models_json_schema([(model, "validation") for model in models])
+    schema["title"] = root_name
+    schema["anyOf"] = list(refs.values())
+
+    schema_path, temp_dir = _write_json_schema_to_tempfile(schema)
+
+    if output_path:
+        generate(
+            input_=schema_path,
+            input_file_type=InputFileType.JsonSchema,
+            output=Path(output_path),
+        )
+        return Path(output_path).read_text(encoding="utf-8")
+    else:
+        return _run_datamodel_codegen(schema_path)
@@ -0,0 +1,209 @@
+"""
+Schema drift detection utilities for Articuno.
+
+Provides a low-overhead monitor that checks records arriving after inference
+against the inferred model. Records whose key set (nested mappings included)
+was already accepted take a fingerprint fast path; on drift the model is
+widened in place or the change is reported through a callback, without
+restarting or rescanning the stream.
+"""
+
+from collections.abc import Mapping
+from typing import (
+    Any, Callable, Dict, FrozenSet, Generator, Iterable, List, NamedTuple, Optional, Set,
+    Tuple, Type, get_args,
+)
+
+from pydantic import BaseModel, ValidationError
+
+from articuno.schema_merge import _merge_specs, _model_to_spec, _record_to_spec, _spec_to_model
+
+
+class SchemaDrift(NamedTuple):
+    """
+    Description of a record that no longer matches the inferred schema.
+
+    Attributes
+    ----------
+    index : int
+        Position of the record in the stream.
+    record : Dict[str, Any]
+        The drifting record.
+    new_keys : FrozenSet[str]
+        Keys present in the record but not in the model. Keys of nested
+        records are given as dotted paths, e.g. ``"user.email"``.
+    missing_keys : FrozenSet[str]
+        Required model fields absent from the record, as dotted paths.
+    errors : List[Dict[str, Any]]
+        Strict validation errors raised by the model, if any. These include
+        values the model would only accept through coercion, e.g. ``"7"``
+        for an ``int`` field.
+    model : Type[BaseModel]
+        The model in effect after the drift was handled (widened if requested).
+    """
+
+    index: int
+    record: Dict[str, Any]
+    new_keys: FrozenSet[str]
+    missing_keys: FrozenSet[str]
+    errors: List[Dict[str, Any]]
+    model: Type[BaseModel]
+
+
+def _fingerprint(value: Any) -> Any:
+    """
+    Compute a hashable fingerprint of the key sets of a record and its nested mappings.
+    """
+    if isinstance(value, Mapping):
+        return frozenset((key, _fingerprint(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return frozenset(_fingerprint(item) for item in value)
+    return None
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """
+    Find the single model class within an annotation, e.g. ``Optional[List[Model]]``.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    models = {_nested_model(arg) for arg in get_args(annotation)} - {None}
+    return models.pop() if len(models) == 1 else None
+
+
+def _key_drift(
+    record: Mapping,
+    model: Type[BaseModel],
+    prefix: str = "",
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Compare the keys of a record and its nested records with a model.
+
+    Parameters
+    ----------
+    record : Mapping
+        Record to compare.
+    model : Type[BaseModel]
+        Model the record should match.
+    prefix : str, optional
+        Dotted path of `record` within the top-level record.
+
+    Returns
+    -------
+    Tuple[FrozenSet[str], FrozenSet[str]]
+        Dotted paths of keys unknown to the model, and of required fields
+        absent from the record.
+    """
+    fields = model.model_fields
+    new_keys: Set[str] = {f"{prefix}{key}" for key in record if key not in fields}
+    missing_keys: Set[str] = {
+        f"{prefix}{name}" for name, field in fields.items()
+        if field.is_required() and name not in record
+    }
+    for name, field in fields.items():
+        value = record.get(name)
+        nested = _nested_model(field.annotation) if value is not None else None
+        if nested is None:
+            continue
+        for item in value if isinstance(value, list) else [value]:
+            if isinstance(item, Mapping):
+                item_new, item_missing = _key_drift(item, nested, f"{prefix}{name}.")
+                new_keys |= item_new
+                missing_keys |= item_missing
+    return frozenset(new_keys), frozenset(missing_keys)
+
+
+def monitor_drift(
+    records: Iterable[Dict[str, Any]],
+    model: Type[BaseModel],
+    on_drift: Optional[Callable[[SchemaDrift], None]] = None,
+    widen: bool = False,
+    force_optional: bool = False,
+) -> Generator[BaseModel, None, None]:
+    """
+    Validate records against a model while watching for schema drift.
+
+    Each record's key set, including the key sets of nested mappings, is
+    fingerprinted; key sets already accepted or reported skip the key
+    comparison and go straight to validation. A record drifts when it or a
+    nested record has keys unknown to the model, lacks required fields, or
+    fails strict validation, i.e. a value only validates through coercion
+    such as ``"7"`` for an ``int`` field. Each drifting key set is reported
+    once; later records with the same key set are only reported again if they
+    fail validation.
+
+    Parameters
+    ----------
+    records : Iterable[Dict[str, Any]]
+        Iterable of dictionary records to validate.
+    model : Type[BaseModel]
+        Model to validate records against.
+    on_drift : Callable[[SchemaDrift], None], optional
+        Called with a `SchemaDrift` for the first record with each new key set,
+        and for every record that fails strict validation.
+    widen : bool, optional
+        If True, widen the model to accept drifting records and keep going.
+        Widened models are rebuilt from field types only.
+    force_optional : bool, optional
+        If True, all fields in widened models will be Optional.
+
+    Yields
+    ------
+    BaseModel
+        An instance of the current model for each accepted record. Records that
+        fail validation without widening are skipped after being reported.
+
+    Raises
+    ------
+    ValidationError
+        If a record fails validation and neither `on_drift` nor `widen` is set.
+        Records that only fail strict validation are coerced and yielded instead.
+    """
+    accepted: set = set()
+    reported: set = set()
+
+    for index, record in enumerate(records):
+        new_keys: FrozenSet[str] = frozenset()
+        missing_keys: FrozenSet[str] = frozenset()
+
+        # Fast path: key set already known to match the model, or already reported
+        fingerprint = _fingerprint(record)
+        if fingerprint not in accepted and fingerprint not in reported:
+            new_keys, missing_keys = _key_drift(record, model)
+            if not new_keys and not missing_keys:
+                accepted.add(fingerprint)
+            else:
+                reported.add(fingerprint)
+
+        errors: List[Dict[str, Any]] = []
+        instance = None
+        try:
+            instance = model.model_validate(record, strict=True)
+        except ValidationError as exc:
+            errors = exc.errors()
+            # Strict failures still yield the coerced record when lax validation passes
+            try:
+                instance = model(**record)
+            except ValidationError:
+                if on_drift is None and not widen:
+                    raise
+            else:
+                if on_drift is None and not widen:
+                    yield instance
+                    continue
+
+        if not new_keys and not missing_keys and not errors:
+            yield instance
+            continue
+
+        if widen:
+            spec = _merge_specs(_model_to_spec(model), _record_to_spec(record))
+            model = _spec_to_model(spec, model.__name__, force_optional=force_optional)
+            accepted.add(fingerprint)
+            instance = model(**record)
+
+        if on_drift is not None:
+            on_drift(SchemaDrift(index, record, new_keys, missing_keys, errors, model))
+
+        if instance is not None:
+            yield instance
@@ -0,0 +1,364 @@
+"""
+Bulk JSON export utilities for Articuno.
+
+Provides a pipeline that validates DataFrame rows or dict records in chunks
+against a Pydantic model and serializes each chunk straight to JSON bytes with
+pydantic-core, writing NDJSON or a JSON array to a file or binary stream.
+Plain models (no custom validators, serializers, aliases or config) are mirrored
+as TypedDicts so rows are validated and dumped without creating model instances.
+"""
+
+import itertools
+from pathlib import Path
+from typing import (
+    Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Type, Union, get_args, get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
+
+from articuno.backend_detect import is_pandas_df, is_polars_df
+from articuno.inference import infer_pydantic_model
+
+
+def _mirror_annotation(annotation: Any, cache: Dict[type, Any]) -> Any:
+    """
+    Replace nested models in an annotation with their TypedDict mirrors.
+
+    Returns None if the annotation contains a model that cannot be mirrored.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_to_typeddict(annotation, cache, nested=True)
+
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    mirrored = tuple(_mirror_annotation(arg, cache) for arg in args)
+    if mirrored == args:
+        return annotation
+    if any(arg is None for arg in mirrored):
+        return None
+
+    origin = get_origin(annotation)
+    if origin is Union or type(annotation).__name__ == "UnionType":
+        return Union[mirrored]
+    if origin is list:
+        return List[mirrored[0]]
+    if origin is dict:
+        return Dict[mirrored[0], mirrored[1]]
+    return None
+
+
+def _model_to_typeddict(
+    model: Type[BaseModel],
+    cache: Optional[Dict[type, Any]] = None,
+    nested: bool = False,
+) -> Any:
+    """
+    Build a TypedDict that validates and serializes like a plain Pydantic model.
+
+    All fields of the mirror are required, so rows must contain every key;
+    `_write_chunks` fills missing optional keys with None, including those of
+    nested models (see `_default_filler`).
+
+    Parameters
+    ----------
+    model : Type[BaseModel]
+        Model to mirror.
+    cache : Dict[type, Any], optional
+        Mirrors already built for nested models.
+    nested : bool, optional
+        True when mirroring a model used inside another model's fields.
+
+    Returns
+    -------
+    Any
+        A TypedDict class, or None if the model has custom validators,
+        serializers, aliases, config or defaults other than None.
+    """
+    cache = {} if cache is None else cache
+    if nested and model in cache:
+        return cache[model]
+
+    decorators = model.__pydantic_decorators__
+    if model.model_config or any((
+        decorators.validators, decorators.field_validators, decorators.root_validators,
+        decorators.field_serializers, decorators.model_serializers,
+        decorators.model_validators, decorators.computed_fields,
+    )):
+        return None
+
+    fields: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if field.alias or field.validation_alias or field.serialization_alias \
+           or field.exclude or field.metadata or field.default_factory is not None:
+            return None
+        if not field.is_required() and field.default is not None:
+            return None
+        typ = _mirror_annotation(field.annotation, cache)
+        if typ is None:
+            return None
+        fields[name] = typ
+
+    mirror = TypedDict(f"{model.__name__}Row", fields)
+    if nested:
+        cache[model] = mirror
+    return mirror
+
+
+def _default_filler(annotation: Any) -> Any:
+    """
+    Build a function that fills missing None-default keys in values of an annotation.
+
+    Models are filled key by key and recursively through their fields, lists,
+    dict values and unions. Input dicts are copied, never modified.
+
+    Returns
+    -------
+    Any
+        A function taking and returning a value, None if values never need
+        filling, or False if they cannot be filled unambiguously (a union of
+        several models that need filling).
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        defaults = {
+            name: None for name, field in annotation.model_fields.items()
+            if not field.is_required() and field.default is None
+        }
+        nested = {}
+        for name, field in annotation.model_fields.items():
+            fill = _default_filler(field.annotation)
+            if fill is False:
+                return False
+            if fill is not None:
+                nested[name] = fill
+        if not defaults and not nested:
+            return None
+
+        def fill_model(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return value
+            if not defaults.keys() <= value.keys():
+                value = {**defaults, **value}
+            for name, fill in nested.items():
+                item = value.get(name)
+                if item is not None:
+                    filled = fill(item)
+                    if filled is not item:
+                        value = {**value, name: filled}
+            return value
+
+        return fill_model
+
+    args = get_args(annotation)
+    fills = [fill for fill in map(_default_filler, args) if fill is not None]
+    if not fills:
+        return None
+    if False in fills:
+        return False
+
+    origin = get_origin(annotation)
+    if origin is Union or type(annotation).__name__ == "UnionType":
+        return fills[0] if len(fills) == 1 else False
+    if origin is list:
+        fill = fills[0]
+        return lambda value: [fill(item) for item in value] if isinstance(value, list) else value
+    if origin is dict and len(args) == 2 and _default_filler(args[0]) is None:
+        fill = fills[0]
+        return lambda value: (
+            {key: fill(item) for key, item in value.items()} if isinstance(value, dict) else value
+        )
+    return False
+
+
+def _pandas_records(chunk: Any) -> List[Dict[str, Any]]:
+    """
+    Convert a pandas DataFrame chunk to row dicts, through Arrow when available.
+
+    Arrow conversion is much faster than ``to_dict`` and maps missing values
+    (NaN, NaT, pd.NA) to None; columns Arrow cannot convert fall back to ``to_dict``.
+    """
+    from articuno.pandas_infer import is_pyarrow_available
+
+    if is_pyarrow_available():
+        import pyarrow as pa  # type: ignore
+        try:
+            return pa.Table.from_pandas(chunk, preserve_index=False).to_pylist()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+    return chunk.to_dict(orient="records")
+
+
+def _iter_chunks(source: Any, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield lists of row dicts from a DataFrame or iterable of dicts.
+
+    Parameters
+    ----------
+    source : pandas.DataFrame, polars.DataFrame, or iterable of dict
+        Rows to split into chunks.
+    chunk_size : int
+        Maximum number of rows per chunk.
+
+    Yields
+    ------
+    List[Dict[str, Any]]
+        The next chunk of row dicts.
+    """
+    if is_pandas_df(source):
+        for start in range(0, len(source), chunk_size):
+            yield _pandas_records(source.iloc[start:start + chunk_size])
+    elif is_polars_df(source):
+        for start in range(0, source.height, chunk_size):
+            yield source.slice(start, chunk_size).to_dicts()
+    else:
+        records = iter(source)
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def _write_chunks(
+    chunks: Iterable[List[Dict[str, Any]]],
+    model: Type[BaseModel],
+    stream: BinaryIO,
+    fmt: str,
+) -> int:
+    """
+    Validate and serialize row chunks to a binary stream.
+
+    Parameters
+    ----------
+    chunks : Iterable[List[Dict[str, Any]]]
+        Chunks of row dicts.
+    model : Type[BaseModel]
+        Model used to validate and serialize rows.
+    stream : BinaryIO
+        Writable binary stream.
+    fmt : str
+        ``"ndjson"`` or ``"array"``.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    # The mirror requires every key, so missing optional keys (nested ones
+    # included) are filled with their None default to match model_dump_json();
+    # models apply their own defaults
+    mirror = _model_to_typeddict(model)
+    fill = _default_filler(model) if mirror is not None else None
+    if fill is False:
+        mirror = fill = None
+    row_type = mirror or model
+    adapter = TypeAdapter(List[row_type])
+    row_adapter = TypeAdapter(row_type)
+    count = 0
+
+    if fmt == "array":
+        stream.write(b"[")
+    for chunk in chunks:
+        if fill is not None:
+            chunk = [fill(row) for row in chunk]
+        # Whole-chunk validation runs in pydantic-core without a per-row Python call
+        rows = adapter.validate_python(chunk)
+        if fmt == "array":
+            if count:
+                stream.write(b",")
+            stream.write(adapter.dump_json(rows)[1:-1])
+        else:
+            # pydantic-core has no NDJSON mode, so each row is dumped separately
+            stream.write(b"\n".join(map(row_adapter.dump_json, rows)))
+            stream.write(b"\n")
+        count += len(rows)
+    if fmt == "array":
+        stream.write(b"]")
+
+    return count
+
+
+def df_to_json(
+    source: Union[Any, Iterable[Dict[str, Any]]],
+    dest: Union[str, Path, BinaryIO],
+    model: Optional[Type[BaseModel]] = None,
+    model_name: Optional[str] = None,
+    force_optional: bool = False,
+    max_scan: int = 1000,
+    fmt: str = "ndjson",
+    chunk_size: int = 10000,
+) -> int:
+    """
+    Validate a DataFrame or iterable of dicts and write it as JSON in chunks.
+
+    Rows are validated a chunk at a time and serialized directly to bytes, so
+    memory stays bounded by `chunk_size`. For plain models, such as those
+    inferred by Articuno, no model instances are created at all; models with
+    custom validators, serializers, aliases or config are validated as regular
+    model instances. Either way the output matches ``model_dump_json()``:
+    optional fields absent from a record, including fields of nested models,
+    are written as null.
+
+    Parameters
+    ----------
+    source : pandas.DataFrame, polars.DataFrame, or iterable of dict
+        Rows to validate and export.
+    dest : str, Path, or binary file-like
+        Output file path, or a writable binary stream.
+    model : Type[BaseModel], optional
+        Pre-existing Pydantic model class to use. If None, a model is inferred.
+    model_name : str, optional
+        Name for the auto-inferred model if `model` is None.
+    force_optional : bool, default False
+        If True, forces all fields in the inferred model to be Optional.
+    max_scan : int, default 1000
+        Maximum records to scan when inferring from a dict iterable.
+    fmt : str, default "ndjson"
+        ``"ndjson"`` for one JSON object per line, or ``"array"`` for a JSON array.
+        Validation is batched per chunk in both cases, but only ``"array"``
+        serializes the whole chunk in one call; ``"ndjson"`` serializes one
+        row at a time and is therefore slower.
+    chunk_size : int, default 10000
+        Number of rows validated and serialized per chunk.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+
+    Raises
+    ------
+    ValueError
+        If `fmt` is not ``"ndjson"`` or ``"array"``.
+    pydantic.ValidationError
+        If a row fails validation.
+    """
+    if fmt not in ("ndjson", "array"):
+        raise ValueError(f"Unsupported JSON format: {fmt!r}. Expected 'ndjson' or 'array'.")
+
+    is_frame = is_pandas_df(source) or is_polars_df(source)
+    if not is_frame:
+        source = iter(source)
+
+    if model is None:
+        if is_frame:
+            model = infer_pydantic_model(
+                source, model_name or "AutoModel", force_optional=force_optional
+            )
+        else:
+            # Scan the head for inference, then replay it ahead of the remaining records
+            head = list(itertools.islice(source, max_scan))
+            model = infer_pydantic_model(
+                head,
+                model_name or "AutoDictModel",
+                force_optional=force_optional,
+                max_scan=max_scan,
+            )
+            source = itertools.chain(head, source)
+
+    chunks = _iter_chunks(source, chunk_size)
+    if isinstance(dest, (str, Path)):
+        with open(dest, "wb") as fh:
+            return _write_chunks(chunks, model, fh, fmt)
+    return _write_chunks(chunks, model, dest, fmt)
@@ -5,13 +5,14 @@ Provides functions to infer Pydantic models strictly from iterables of dict reco
 using pydantic.create_model and the nested-dict logic extracted.
 """
 
-from typing import Any, Dict, Iterable, Type, Optional, Generator, List, Union
+from typing import Any, Callable, Dict, Iterable, Type, Optional, Generator, List, Union
 from pydantic import BaseModel, create_model
 import itertools
 from collections.abc import Mapping
 
 # Nested dict-model logic
 from articuno.dict_model import _infer_dict_model
+from articuno.drift import SchemaDrift, monitor_drift
 
 
 def infer_generic_model(
@@ -99,10 +100,16 @@ def dicts_to_pydantic(
     model_name: str = "AutoDictModel",
     scan_limit: int = 1000,
     force_optional: bool = False,
+    on_drift: Optional[Callable[[SchemaDrift], None]] = None,
+    widen_on_drift: bool = False,
 ) -> Generator[BaseModel, None, None]:
     """
     Convert an iterable of dicts into a generator of Pydantic model instances.
 
+    When `on_drift` or `widen_on_drift` is given, records are checked against
+    the model for schema drift (new keys, missing fields or type changes)
+    after inference; see `articuno.drift.monitor_drift`.
+
     Parameters
     ----------
     records : Iterable[Dict[str, Any]]
@@ -115,6 +122,11 @@ def dicts_to_pydantic(
         Maximum number of records to scan for inference.
     force_optional : bool, optional
         If True, all fields in the inferred model will be Optional.
+    on_drift : Callable[[SchemaDrift], None], optional
+        Called with a `SchemaDrift` for the first record with each new key set,
+        and for every record that fails strict validation.
+    widen_on_drift : bool, optional
+        If True, widen the model to accept drifting records instead of failing.
 
     Yields
     ------
@@ -133,5 +145,15 @@ def dicts_to_pydantic(
             force_optional=force_optional,
         )
 
+    if on_drift is not None or widen_on_drift:
+        yield from monitor_drift(
+            records,
+            model,
+            on_drift=on_drift,
+            widen=widen_on_drift,
+            force_optional=force_optional,
+        )
+        return
+
     for record in records:
         yield model(**record)
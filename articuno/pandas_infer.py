@@ -3,16 +3,19 @@ Pandas DataFrame model inference utilities for Articuno.
 
 Provides functions to convert pandas DataFrames into Pydantic models,
 with explicit support for PyArrow extension dtypes when available,
+pandas nullable, categorical and timezone-aware dtypes,
 and nested dict columns using `dict_model._infer_dict_model`.
 """
 
-from typing import Any, Dict, List, Tuple, Type
-from pydantic import BaseModel, create_model
+from typing import Any, Dict, List, Literal, Tuple, Type
+from pydantic import AwareDatetime, BaseModel, create_model
 import datetime
 import pandas as pd
 
-# Nested dict model inference logic
+# Nested dict and Arrow struct model inference logic
 from articuno.dict_model import _infer_dict_model
+from articuno.arrow_model import _arrow_type_to_python
+from articuno.schema_merge import MAX_LITERAL_CATEGORIES
 
 
 def is_pyarrow_available() -> bool:
@@ -31,15 +34,89 @@ def is_pyarrow_available() -> bool:
         return False
 
 
+def _infer_type_from_dtype(
+    dtype: Any,
+    col_name: str,
+    force_optional: bool,
+    max_categories: int = MAX_LITERAL_CATEGORIES,
+) -> Any:
+    """
+    Infer the Python type for a pandas dtype using only dtype metadata.
+
+    Parameters
+    ----------
+    dtype : Any
+        pandas or numpy dtype to analyze.
+    col_name : str
+        Column name (used for nested model naming).
+    force_optional : bool
+        If True, fields of nested models become Optional.
+    max_categories : int
+        Categoricals with at most this many categories become a ``Literal``.
+
+    Returns
+    -------
+    Any
+        Inferred Python type, or ``None`` if the values must be sampled.
+    """
+    # Categoricals: small category sets become Literal, otherwise the category type
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = dtype.categories
+        values = categories.tolist()
+        if 0 < len(values) <= max_categories \
+           and all(isinstance(v, (str, int, bool)) for v in values):
+            return Literal[tuple(values)]
+        return _infer_type_from_dtype(
+            categories.dtype, col_name, force_optional, max_categories
+        )
+
+    # PyArrow-backed checks
+    if is_pyarrow_available() and hasattr(dtype, "pyarrow_dtype"):
+        return _arrow_type_to_python(
+            dtype.pyarrow_dtype, col_name, force_optional=force_optional
+        )
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return bool
+    if pd.api.types.is_integer_dtype(dtype):
+        return int
+    if pd.api.types.is_float_dtype(dtype):
+        return float
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return AwareDatetime
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return datetime.datetime
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        return datetime.timedelta
+    if isinstance(dtype, pd.StringDtype):
+        return str
+    if pd.api.types.is_object_dtype(dtype):
+        return None
+    return Any
+
+
+def _series_has_nulls(series: pd.Series) -> bool:
+    """
+    Check whether a Series contains nulls, using Arrow null counts when available.
+    """
+    if is_pyarrow_available() and hasattr(series.dtype, "pyarrow_dtype"):
+        return series.array.__arrow_array__().null_count > 0
+    return bool(series.isnull().any())
+
+
 def _infer_type_from_series(
     series: pd.Series,
     col_name: str,
     force_optional: bool,
     sample_size: int = 100,
+    max_categories: int = MAX_LITERAL_CATEGORIES,
 ) -> Tuple[Any, Any]:
     """
     Infer Python and Pydantic type for a pandas Series, supporting PyArrow dtypes.
 
+    Extension, categorical, datetime and Arrow dtypes are inferred from dtype
+    metadata alone; only object columns are sampled.
+
     Parameters
     ----------
     series : pd.Series
@@ -50,6 +127,8 @@ def _infer_type_from_series(
         If True, all fields become Optional.
     sample_size : int
         Number of samples for object dtype inference.
+    max_categories : int
+        Categoricals with at most this many categories become a ``Literal``.
 
     Returns
     -------
@@ -59,36 +138,15 @@ def _infer_type_from_series(
         Default value (None or ...) for the Pydantic field.
     """
     # Determine nullability
-    nullable = series.isnull().any()
-    non_null = series.dropna()
-    samples = non_null.head(sample_size).tolist()
-    sample_val = samples[0] if samples else None
+    nullable = _series_has_nulls(series)
 
-    # PyArrow-backed checks
-    if is_pyarrow_available() and hasattr(series.dtype, "arrow_dtype"):
-        import pyarrow as pa  # type: ignore
-        arrow_dtype = series.dtype.arrow_dtype
-        if pa.types.is_integer(arrow_dtype):
-            typ = int
-        elif pa.types.is_floating(arrow_dtype):
-            typ = float
-        elif pa.types.is_string(arrow_dtype):
-            typ = str
-        elif pa.types.is_boolean(arrow_dtype):
-            typ = bool
-        else:
-            typ = Any
-    elif pd.api.types.is_integer_dtype(series.dtype):
-        typ = int
-    elif pd.api.types.is_float_dtype(series.dtype):
-        typ = float
-    elif pd.api.types.is_bool_dtype(series.dtype):
-        typ = bool
-    elif pd.api.types.is_datetime64_any_dtype(series.dtype):
-        typ = datetime.datetime
-    elif pd.api.types.is_object_dtype(series.dtype):
+    typ = _infer_type_from_dtype(series.dtype, col_name, force_optional, max_categories)
+    if typ is None:
+        # Object dtype: sample values
+        samples = series.dropna().head(sample_size).tolist()
+        sample_val = samples[0] if samples else None
         # Nested dict
-        if all(isinstance(x, dict) for x in samples if x is not None):
+        if samples and all(isinstance(x, dict) for x in samples):
             typ = _infer_dict_model(samples, col_name, force_optional=force_optional)
         # List
         elif isinstance(sample_val, list):
@@ -98,8 +156,6 @@ def _infer_type_from_series(
             typ = str
         else:
             typ = Any
-    else:
-        typ = Any
 
     # Assign default and optional
     if force_optional or nullable:
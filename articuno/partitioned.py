@@ -0,0 +1,241 @@
+"""
+Partitioned inference utilities for Articuno.
+
+Provides map-reduce schema inference across many partitions (DataFrames,
+lists of dict records, or data files). File partitions are inferred in worker
+processes and in-memory partitions in the current process. Each is reduced to
+a picklable schema spec; the specs are then merged with the widening rules
+from `schema_merge` into a single Pydantic model.
+"""
+
+import functools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Type
+
+from pydantic import BaseModel
+
+from articuno.arrow_model import _infer_schema_model
+from articuno.inference import infer_pydantic_model
+from articuno.schema_merge import ModelSpec, _merge_specs, _model_to_spec, _spec_to_model
+
+
+def _read_parquet_schema(path: Path) -> Any:
+    """
+    Read the Arrow schema of a Parquet file from its footer, without reading rows.
+
+    Top-level columns whose row-group statistics report zero nulls everywhere
+    are marked non-nullable.
+
+    Parameters
+    ----------
+    path : Path
+        Path to a ``.parquet`` file.
+
+    Returns
+    -------
+    pyarrow.Schema
+        Schema of the file with nullability refined from statistics.
+    """
+    import pyarrow.parquet as pq  # type: ignore
+
+    parquet_file = pq.ParquetFile(path)
+    schema = parquet_file.schema_arrow
+    metadata = parquet_file.metadata
+
+    # Null counts per top-level primitive column across all row groups
+    non_null = {field.name for field in schema} if metadata.num_row_groups else set()
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        for i in range(row_group.num_columns):
+            column = row_group.column(i)
+            stats = column.statistics
+            nested = "." in column.path_in_schema
+            if nested or stats is None or not stats.has_null_count or stats.null_count > 0:
+                non_null.discard(column.path_in_schema.split(".")[0])
+
+    for i, field in enumerate(schema):
+        if field.name in non_null:
+            schema = schema.set(i, field.with_nullable(False))
+    return schema
+
+
+def _read_source(path: Path, max_scan: int) -> Any:
+    """
+    Read a data file into a source accepted by `infer_pydantic_model`.
+
+    Parameters
+    ----------
+    path : Path
+        Path to a ``.csv``, ``.ndjson``/``.jsonl`` or ``.json`` file.
+    max_scan : int
+        Maximum number of rows to read from row-oriented formats.
+
+    Returns
+    -------
+    Any
+        A pandas DataFrame or a list of dict records.
+
+    Raises
+    ------
+    ValueError
+        If the file extension is not supported.
+    """
+    suffix = path.suffix.lower()
+    if suffix in (".ndjson", ".jsonl"):
+        records = []
+        with path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                if len(records) >= max_scan:
+                    break
+                if line.strip():
+                    records.append(json.loads(line))
+        return records
+    if suffix == ".json":
+        with path.open("r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        return data[:max_scan] if isinstance(data, list) else [data]
+    if suffix == ".csv":
+        import pandas as pd
+        return pd.read_csv(path, nrows=max_scan)
+    raise ValueError(f"Unsupported file type for inference: {path}")
+
+
+def _infer_partition_spec(
+    partition: Any,
+    loader: Optional[Callable[[Any], Any]],
+    force_optional: bool,
+    max_scan: int,
+) -> ModelSpec:
+    """
+    Infer the partial schema spec of a single partition (map step).
+
+    Parameters
+    ----------
+    partition : Any
+        A DataFrame, list of dict records, file path, or any value accepted by `loader`.
+    loader : Callable[[Any], Any], optional
+        Turns `partition` into an inference source inside the worker.
+    force_optional : bool
+        If True, all fields are made Optional.
+    max_scan : int
+        Maximum number of records to scan per partition.
+
+    Returns
+    -------
+    ModelSpec
+        Picklable schema spec of the partition.
+    """
+    if loader is not None:
+        source = loader(partition)
+    elif isinstance(partition, (str, os.PathLike)):
+        path = Path(partition)
+        if path.suffix.lower() == ".parquet":
+            # Schema-only read from the Parquet footer
+            schema = _read_parquet_schema(path)
+            return _model_to_spec(
+                _infer_schema_model(schema, "PartitionModel", force_optional=force_optional)
+            )
+        source = _read_source(path, max_scan)
+    else:
+        source = partition
+
+    model = infer_pydantic_model(
+        source,
+        model_name="PartitionModel",
+        force_optional=force_optional,
+        max_scan=max_scan,
+    )
+    return _model_to_spec(model)
+
+
+def infer_partitioned_model(
+    partitions: Iterable[Any],
+    model_name: str = "AutoModel",
+    force_optional: bool = False,
+    max_scan: int = 1000,
+    loader: Optional[Callable[[Any], Any]] = None,
+    max_workers: Optional[int] = None,
+) -> Type[BaseModel]:
+    """
+    Infer a single Pydantic model from many partitions using a process pool.
+
+    File and `loader` partitions are inferred in parallel worker processes;
+    in-memory DataFrames and lists of dicts are inferred in the current process,
+    since copying them to a worker costs more than their (dtype-driven)
+    inference. The partial schemas are reduced with type widening: ``int`` and
+    ``float`` widen to ``float``, fields missing or null in some partitions
+    become Optional, nested models are merged field by field, and unrelated
+    types become a Union.
+
+    Parameters
+    ----------
+    partitions : Iterable[Any]
+        Partitions to infer from: pandas/polars DataFrames, lists of dict
+        records, or paths to ``.parquet``, ``.csv``, ``.ndjson``/``.jsonl``
+        or ``.json`` files. Paths are read inside the worker processes; Parquet
+        files are inferred from their footer schema without reading rows.
+    model_name : str, default "AutoModel"
+        Name to assign to the generated Pydantic model class.
+    force_optional : bool, default False
+        If True, forces all fields in the generated model to be Optional.
+    max_scan : int, default 1000
+        Maximum number of records to scan per partition.
+    loader : Callable[[Any], Any], optional
+        Picklable function run in the worker to turn a partition into a source,
+        e.g. to read a custom storage format.
+    max_workers : int, optional
+        Number of worker processes for file and `loader` partitions. Defaults
+        to the number of CPUs; with one worker, inference runs in the current process.
+
+    Returns
+    -------
+    Type[BaseModel]
+        Dynamically created Pydantic model class.
+
+    Raises
+    ------
+    ValueError
+        If no partitions are provided.
+    """
+    partitions = list(partitions)
+    if not partitions:
+        raise ValueError("Cannot infer schema from an empty collection of partitions.")
+
+    infer_partition = functools.partial(
+        _infer_partition_spec,
+        loader=loader,
+        force_optional=force_optional,
+        max_scan=max_scan,
+    )
+
+    # Only partitions read inside the worker are worth sending to the pool;
+    # in-memory partitions would be pickled whole just to read their dtypes.
+    remote = [
+        i for i, partition in enumerate(partitions)
+        if loader is not None or isinstance(partition, (str, os.PathLike))
+    ]
+    remote_set = set(remote)
+    specs: List[Optional[ModelSpec]] = [
+        None if i in remote_set else infer_partition(partition)
+        for i, partition in enumerate(partitions)
+    ]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(remote))
+    if workers <= 1:
+        for i in remote:
+            specs[i] = infer_partition(partitions[i])
+    elif remote:
+        # Map in worker processes; results keep partition order for the reduce
+        chunksize = max(1, len(remote) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            remote_specs = executor.map(
+                infer_partition, [partitions[i] for i in remote], chunksize=chunksize
+            )
+            for i, spec in zip(remote, remote_specs):
+                specs[i] = spec
+
+    merged = functools.reduce(_merge_specs, specs)
+    return _spec_to_model(merged, model_name, force_optional=force_optional)
@@ -0,0 +1,454 @@
+"""
+Schema merging utilities for Articuno.
+
+Provides a lightweight, picklable description of an inferred model schema
+("spec") and well-defined type widening rules to merge specs, so models can be
+widened on drift or combined across partitions and rebuilt with create_model.
+
+A model spec maps field names to ``(type_spec, required)`` pairs. Type specs are
+plain Python types, ``Any``, ``NoneType`` (only nulls seen), or tagged tuples:
+``("list", inner)``, ``("dict", key, value)``, ``("literal", values)``,
+``("union", members)`` and ``("model", name, fields)``. Specs built from a
+whitelist of plain types can also be encoded to and decoded from JSON.
+"""
+
+import datetime
+import decimal
+from collections.abc import Mapping
+from typing import (
+    Any, Dict, List, Literal, Optional, Tuple, Type, Union, get_args, get_origin,
+)
+
+from pydantic import AwareDatetime, BaseModel, create_model
+
+NoneType = type(None)
+
+# Types a spec may name when encoded as JSON; anything else is not encodable
+_JSON_TYPES: Dict[str, Any] = {
+    "Any": Any,
+    "None": NoneType,
+    "bool": bool,
+    "int": int,
+    "float": float,
+    "str": str,
+    "bytes": bytes,
+    "list": list,
+    "dict": dict,
+    "Decimal": decimal.Decimal,
+    "datetime": datetime.datetime,
+    "AwareDatetime": AwareDatetime,
+    "date": datetime.date,
+    "time": datetime.time,
+    "timedelta": datetime.timedelta,
+}
+_JSON_TYPE_NAMES = {typ: name for name, typ in _JSON_TYPES.items()}
+
+# Literal types (e.g. from categoricals) with at most this many values are kept;
+# larger literals collapse to their base type
+MAX_LITERAL_CATEGORIES = 50
+
+ModelSpec = Dict[str, Tuple[Any, bool]]
+
+
+def _is_tagged(spec: Any, tag: str) -> bool:
+    """
+    Check whether a type spec is a tagged tuple with the given tag.
+    """
+    return isinstance(spec, tuple) and len(spec) > 0 and spec[0] == tag
+
+
+def _annotation_to_spec(annotation: Any) -> Any:
+    """
+    Convert a type annotation into a picklable type spec.
+
+    Parameters
+    ----------
+    annotation : Any
+        Field annotation taken from a Pydantic model.
+
+    Returns
+    -------
+    Any
+        Type spec describing the annotation. Unrecognized annotations are kept as-is.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return ("model", annotation.__name__, _model_to_spec(annotation))
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union or type(annotation).__name__ == "UnionType":
+        return ("union", tuple(_annotation_to_spec(arg) for arg in args))
+    if origin is list:
+        return ("list", _annotation_to_spec(args[0]) if args else Any)
+    if origin is dict:
+        if not args:
+            return ("dict", Any, Any)
+        return ("dict", _annotation_to_spec(args[0]), _annotation_to_spec(args[1]))
+    if origin is Literal:
+        return ("literal", tuple(args))
+    return annotation
+
+
+def _model_to_spec(model: Type[BaseModel]) -> ModelSpec:
+    """
+    Convert a Pydantic model class into a picklable model spec.
+
+    Parameters
+    ----------
+    model : Type[BaseModel]
+        Model class to describe.
+
+    Returns
+    -------
+    ModelSpec
+        Mapping of field name to ``(type_spec, required)``.
+    """
+    return {
+        name: (_annotation_to_spec(field.annotation), field.is_required())
+        for name, field in model.model_fields.items()
+    }
+
+
+def _value_to_spec(value: Any, field_name: str) -> Any:
+    """
+    Infer a type spec from a single Python value.
+
+    Parameters
+    ----------
+    value : Any
+        Value to describe.
+    field_name : str
+        Name of the field, used to name nested models.
+
+    Returns
+    -------
+    Any
+        Type spec for the value.
+    """
+    if value is None:
+        return NoneType
+    if isinstance(value, Mapping):
+        return ("model", f"{field_name}_NestedModel", _record_to_spec(value))
+    if isinstance(value, list):
+        return ("list", Any)
+    if isinstance(value, (bool, int, float, str)):
+        return type(value)
+    return Any
+
+
+def _record_to_spec(record: Mapping) -> ModelSpec:
+    """
+    Infer a model spec from a single dict record.
+
+    Parameters
+    ----------
+    record : Mapping
+        Record to describe.
+
+    Returns
+    -------
+    ModelSpec
+        Mapping of field name to ``(type_spec, required)``.
+    """
+    return {key: (_value_to_spec(val, key), True) for key, val in record.items()}
+
+
+def _union_members(spec: Any) -> List[Any]:
+    """
+    Flatten a type spec into its union members.
+    """
+    if _is_tagged(spec, "union"):
+        members: List[Any] = []
+        for member in spec[1]:
+            members.extend(_union_members(member))
+        return members
+    return [spec]
+
+
+def _combine(a: Any, b: Any) -> Any:
+    """
+    Combine two non-union type specs into one, or return None if they are unrelated.
+    """
+    if a == b:
+        return a
+    if (a, b) in ((int, float), (float, int)):
+        return float
+    if _is_tagged(a, "list") and _is_tagged(b, "list"):
+        return ("list", _widen_spec(a[1], b[1]))
+    if _is_tagged(a, "dict") and _is_tagged(b, "dict"):
+        return ("dict", _widen_spec(a[1], b[1]), _widen_spec(a[2], b[2]))
+    if _is_tagged(a, "model") and _is_tagged(b, "model"):
+        return ("model", a[1], _merge_specs(a[2], b[2]))
+    if _is_tagged(a, "literal") and _is_tagged(b, "literal"):
+        values = a[1] + tuple(v for v in b[1] if v not in a[1])
+        if len(values) <= MAX_LITERAL_CATEGORIES:
+            return ("literal", values)
+        # Too many values: collapse to the shared base type(s)
+        base_types = tuple(dict.fromkeys(type(v) for v in values))
+        return base_types[0] if len(base_types) == 1 else ("union", base_types)
+    for lit, typ in ((a, b), (b, a)):
+        if _is_tagged(lit, "literal") and isinstance(typ, type) \
+           and all(type(v) is typ for v in lit[1]):
+            return typ
+    return None
+
+
+def _widen_spec(a: Any, b: Any) -> Any:
+    """
+    Widen two type specs into the narrowest spec accepting both.
+
+    Rules: equal types are kept, ``int`` and ``float`` widen to ``float``,
+    ``NoneType`` makes the result Optional, lists, dicts and nested models are
+    widened element-wise, literals are unioned up to `MAX_LITERAL_CATEGORIES`
+    values and collapse to their base type beyond it, ``Any`` absorbs everything, and
+    any remaining unrelated types become a union.
+
+    Parameters
+    ----------
+    a : Any
+        First type spec.
+    b : Any
+        Second type spec.
+
+    Returns
+    -------
+    Any
+        Widened type spec.
+    """
+    merged: List[Any] = []
+    for member in _union_members(a) + _union_members(b):
+        if member is Any:
+            return Any
+        for i, existing in enumerate(merged):
+            combined = _combine(existing, member)
+            if combined is not None:
+                merged[i] = combined
+                break
+        else:
+            merged.append(member)
+
+    if len(merged) == 1:
+        return merged[0]
+    return ("union", tuple(merged))
+
+
+def _merge_specs(a: ModelSpec, b: ModelSpec) -> ModelSpec:
+    """
+    Merge two model specs, widening shared fields and making missing fields optional.
+
+    Parameters
+    ----------
+    a : ModelSpec
+        First model spec. Its field order is preserved.
+    b : ModelSpec
+        Second model spec. Fields only present here are appended.
+
+    Returns
+    -------
+    ModelSpec
+        Merged model spec.
+    """
+    merged: ModelSpec = {}
+    for key, (spec, required) in a.items():
+        if key in b:
+            other_spec, other_required = b[key]
+            merged[key] = (_widen_spec(spec, other_spec), required and other_required)
+        else:
+            merged[key] = (spec, False)
+    for key, (spec, _required) in b.items():
+        if key not in a:
+            merged[key] = (spec, False)
+    return merged
+
+
+def _spec_to_annotation(spec: Any, force_optional: bool = False, name_prefix: str = "") -> Any:
+    """
+    Convert a type spec back into a type annotation.
+
+    Parameters
+    ----------
+    spec : Any
+        Type spec to convert.
+    force_optional : bool, optional
+        If True, fields of nested models become Optional.
+    name_prefix : str, optional
+        Prefix prepended to the names of nested model classes.
+
+    Returns
+    -------
+    Any
+        Type annotation usable with ``create_model``.
+    """
+    if spec is NoneType:
+        return Any
+    if _is_tagged(spec, "list"):
+        return List[_spec_to_annotation(spec[1], force_optional, name_prefix)]
+    if _is_tagged(spec, "dict"):
+        return Dict[
+            _spec_to_annotation(spec[1], force_optional, name_prefix),
+            _spec_to_annotation(spec[2], force_optional, name_prefix),
+        ]
+    if _is_tagged(spec, "literal"):
+        return Literal[spec[1]]
+    if _is_tagged(spec, "model"):
+        return _spec_to_model(
+            spec[2], f"{name_prefix}{spec[1]}",
+            force_optional=force_optional, name_prefix=name_prefix,
+        )
+    if _is_tagged(spec, "union"):
+        members = [m for m in spec[1] if m is not NoneType]
+        annotations = tuple(_spec_to_annotation(m, force_optional, name_prefix) for m in members)
+        typ = annotations[0] if len(annotations) == 1 else Union[annotations]
+        return Optional[typ] if len(members) < len(spec[1]) else typ
+    return spec
+
+
+def _spec_to_model(
+    spec: ModelSpec,
+    model_name: str,
+    force_optional: bool = False,
+    name_prefix: str = "",
+) -> Type[BaseModel]:
+    """
+    Build a Pydantic model class from a model spec.
+
+    Parameters
+    ----------
+    spec : ModelSpec
+        Mapping of field name to ``(type_spec, required)``.
+    model_name : str
+        Name of the generated Pydantic model class.
+    force_optional : bool, optional
+        If True, all fields are made Optional regardless of the spec.
+    name_prefix : str, optional
+        Prefix prepended to the names of nested model classes, e.g. to keep
+        them unique when several models are generated into one module.
+
+    Returns
+    -------
+    Type[BaseModel]
+        Dynamically created Pydantic model class.
+    """
+    fields: Dict[str, tuple] = {}
+    for key, (type_spec, required) in spec.items():
+        typ = _spec_to_annotation(type_spec, force_optional=force_optional, name_prefix=name_prefix)
+        nullable = type_spec is NoneType or NoneType in _union_members(type_spec)
+
+        if force_optional or nullable or not required:
+            typ = Optional[typ]
+            default = None
+        else:
+            default = ...
+
+        fields[key] = (typ, default)
+
+    return create_model(model_name, **fields)
+
+
+def _spec_to_json(spec: Any) -> Any:
+    """
+    Encode a type spec as JSON-compatible data.
+
+    Parameters
+    ----------
+    spec : Any
+        Type spec to encode.
+
+    Returns
+    -------
+    Any
+        JSON-compatible representation of the spec.
+
+    Raises
+    ------
+    ValueError
+        If the spec names a type outside the JSON whitelist.
+    """
+    if _is_tagged(spec, "list"):
+        return {"list": _spec_to_json(spec[1])}
+    if _is_tagged(spec, "dict"):
+        return {"dict": [_spec_to_json(spec[1]), _spec_to_json(spec[2])]}
+    if _is_tagged(spec, "literal"):
+        if not all(v is None or isinstance(v, (bool, int, float, str)) for v in spec[1]):
+            raise ValueError(f"Cannot encode literal values: {spec[1]!r}")
+        return {"literal": list(spec[1])}
+    if _is_tagged(spec, "union"):
+        return {"union": [_spec_to_json(member) for member in spec[1]]}
+    if _is_tagged(spec, "model"):
+        return {"model": spec[1], "fields": _model_spec_to_json(spec[2])}
+    try:
+        return {"type": _JSON_TYPE_NAMES[spec]}
+    except (KeyError, TypeError):
+        raise ValueError(f"Cannot encode type spec: {spec!r}") from None
+
+
+def _spec_from_json(data: Any) -> Any:
+    """
+    Decode a type spec produced by `_spec_to_json`.
+
+    Parameters
+    ----------
+    data : Any
+        JSON-compatible representation of a spec.
+
+    Returns
+    -------
+    Any
+        The decoded type spec.
+
+    Raises
+    ------
+    ValueError
+        If the data is malformed or names a type outside the JSON whitelist.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Malformed type spec: {data!r}")
+    if "type" in data:
+        if data["type"] not in _JSON_TYPES:
+            raise ValueError(f"Unknown type in spec: {data['type']!r}")
+        return _JSON_TYPES[data["type"]]
+    if "list" in data:
+        return ("list", _spec_from_json(data["list"]))
+    if "dict" in data and isinstance(data["dict"], list) and len(data["dict"]) == 2:
+        return ("dict", _spec_from_json(data["dict"][0]), _spec_from_json(data["dict"][1]))
+    if "literal" in data and isinstance(data["literal"], list):
+        return ("literal", tuple(data["literal"]))
+    if "union" in data and isinstance(data["union"], list):
+        return ("union", tuple(_spec_from_json(member) for member in data["union"]))
+    if "model" in data and isinstance(data["model"], str):
+        return ("model", data["model"], _model_spec_from_json(data.get("fields")))
+    raise ValueError(f"Malformed type spec: {data!r}")
+
+
+def _model_spec_to_json(spec: ModelSpec) -> Dict[str, Any]:
+    """
+    Encode a model spec as JSON-compatible data.
+
+    Raises
+    ------
+    ValueError
+        If a field names a type outside the JSON whitelist.
+    """
+    return {
+        name: [_spec_to_json(type_spec), required]
+        for name, (type_spec, required) in spec.items()
+    }
+
+
+def _model_spec_from_json(data: Any) -> ModelSpec:
+    """
+    Decode a model spec produced by `_model_spec_to_json`.
+
+    Raises
+    ------
+    ValueError
+        If the data is malformed or names a type outside the JSON whitelist.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Malformed model spec: {data!r}")
+    spec: ModelSpec = {}
+    for name, field in data.items():
+        if not isinstance(field, list) or len(field) != 2 or not isinstance(field[1], bool):
+            raise ValueError(f"Malformed field spec for {name!r}: {field!r}")
+        spec[name] = (_spec_from_json(field[0]), field[1])
+    return spec
@@ -31,3 +31,260 @@ def test_pandas_inference_nested():
     models = df_to_pydantic(df, model_name="UserModel")
     assert models[0].user["name"] == "Alice"
     assert models[1].active is False
+
+
+@pytest.mark.skipif(pd is None, reason="pandas not installed")
+def test_pandas_inference_extension_dtypes():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "count": pd.array([1, None], dtype="Int64"),
+        "color": pd.Categorical(["red", "blue"]),
+        "meta": pd.Series(
+            [{"x": 1}, {"x": 2}],
+            dtype=pd.ArrowDtype(pa.struct([("x", pa.int64())])),
+        ),
+    })
+    model = infer_pydantic_model(df, model_name="ExtModel")
+    instance = model(count=None, color="red", meta={"x": 1})
+    assert instance.meta.x == 1
+    with pytest.raises(ValueError):
+        model(count=1, color="green", meta={"x": 1})
+
+
+def test_dicts_to_pydantic_widens_on_drift():
+    from articuno import dicts_to_pydantic
+
+    records = [{"id": 1, "name": "A"}, {"id": 2.5, "name": "B", "tag": "x"}]
+    drifts = []
+    instances = list(dicts_to_pydantic(
+        iter(records), scan_limit=1, widen_on_drift=True, on_drift=drifts.append
+    ))
+    assert [d.index for d in drifts] == [1]
+    assert drifts[0].new_keys == {"tag"}
+    assert instances[1].id == 2.5
+    assert instances[1].tag == "x"
+
+
+def test_infer_partitioned_model_widens_types():
+    from articuno import infer_partitioned_model
+
+    partitions = [
+        [{"id": 1, "name": "A"}],
+        [{"id": 2.5, "name": "B", "tag": "x"}],
+    ]
+    model = infer_partitioned_model(partitions, model_name="Merged", max_workers=2)
+    assert model.model_fields["id"].annotation is float
+    assert model.model_fields["name"].is_required()
+    assert not model.model_fields["tag"].is_required()
+    assert model(id=1.5, name="C").tag is None
+
+
+@pytest.mark.skipif(pd is None, reason="pandas not installed")
+def test_df_to_json_writes_ndjson_and_array():
+    import io
+    import json
+    from articuno import df_to_json
+
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["A", "B", "C"]})
+    ndjson = io.BytesIO()
+    assert df_to_json(df, ndjson, chunk_size=2) == 3
+    lines = ndjson.getvalue().decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+    array = io.BytesIO()
+    df_to_json(df, array, fmt="array", chunk_size=2)
+    assert json.loads(array.getvalue()) == df.to_dict(orient="records")
+
+
+def test_cli_generates_module_and_skips_unchanged(tmp_path, capsys):
+    from articuno.cli import main
+
+    source = tmp_path / "user_events.ndjson"
+    source.write_text('{"id": 1, "name": "A"}\n{"id": 2, "name": "B"}\n')
+    output = tmp_path / "models.py"
+
+    assert main([str(tmp_path / "*.ndjson"), "-o", str(output), "-j", "1"]) == 0
+    assert "class UserEvents(BaseModel)" in output.read_text()
+
+    assert main([str(source), "-o", str(output), "-j", "1"]) == 0
+    assert "up to date" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(pd is None, reason="pandas not installed")
+def test_infer_partitioned_model_dataframe_partitions():
+    from articuno import infer_partitioned_model
+
+    partitions = [
+        pd.DataFrame({"id": [1, 2], "name": ["A", "B"]}),
+        pd.DataFrame({"id": [1.5], "score": [3.0]}),
+    ]
+    model = infer_partitioned_model(partitions, model_name="Frames", max_workers=4)
+    assert list(model.model_fields) == ["id", "name", "score"]
+    assert model.model_fields["id"].annotation is float
+    assert not model.model_fields["score"].is_required()
+
+
+@pytest.mark.skipif(pd is None, reason="pandas not installed")
+def test_infer_partitioned_model_caps_merged_literals():
+    from articuno import infer_partitioned_model
+
+    partitions = [
+        pd.DataFrame({"code": pd.Categorical([f"{p}{i}" for i in range(40)])})
+        for p in "abc"
+    ]
+    model = infer_partitioned_model(partitions, model_name="Codes")
+    assert model.model_fields["code"].annotation is str
+
+
+def test_df_to_json_writes_missing_optional_keys_as_null():
+    import io
+    from typing import Optional
+    from pydantic import BaseModel, ConfigDict
+    from articuno import df_to_json
+
+    class Plain(BaseModel):
+        a: int
+        b: Optional[int] = None
+
+    class Frozen(Plain):
+        model_config = ConfigDict(frozen=True)
+
+    for model in (Plain, Frozen):
+        out = io.BytesIO()
+        df_to_json([{"a": 1}], out, model=model)
+        assert out.getvalue() == model(a=1).model_dump_json().encode() + b"\n"
+
+
+def test_df_to_json_applies_model_defaults():
+    import io
+    from typing import List
+    from pydantic import BaseModel, Field
+    from articuno import df_to_json
+
+    class Defaults(BaseModel):
+        a: int
+        b: int = 5
+        tags: List[str] = Field(default_factory=list)
+
+    out = io.BytesIO()
+    df_to_json([{"a": 1}, {"a": 2, "b": 3, "tags": ["x"]}], out, model=Defaults)
+    assert out.getvalue().splitlines() == [
+        Defaults(a=1).model_dump_json().encode(),
+        Defaults(a=2, b=3, tags=["x"]).model_dump_json().encode(),
+    ]
+
+
+def test_df_to_json_mirrors_nested_optional_fields():
+    import io
+    from articuno import df_to_json
+    from articuno.export import _model_to_typeddict
+
+    records = [{"id": 1, "u": {"a": 1, "b": 2}}, {"id": 2, "u": {"a": 3}}]
+    model = infer_pydantic_model(records, model_name="Nested")
+    assert _model_to_typeddict(model) is not None
+
+    out = io.BytesIO()
+    df_to_json(records, out, model=model)
+    assert out.getvalue().splitlines() == [
+        model(**record).model_dump_json().encode() for record in records
+    ]
+    assert records[1] == {"id": 2, "u": {"a": 3}}
+
+
+def test_dicts_to_pydantic_reports_new_key_set_once():
+    from articuno import dicts_to_pydantic
+
+    records = [{"id": 1}, {"id": 2, "tag": "x"}, {"id": 3, "tag": "y"}]
+    drifts = []
+    instances = list(dicts_to_pydantic(iter(records), scan_limit=1, on_drift=drifts.append))
+    assert len(instances) == 3
+    assert [d.index for d in drifts] == [1]
+    assert drifts[0].new_keys == {"tag"}
+
+
+def test_dicts_to_pydantic_reports_nested_key_drift():
+    from articuno import dicts_to_pydantic
+
+    records = [{"id": 1, "u": {"a": 1}}, {"id": 2, "u": {"a": 2, "b": 3}}]
+    drifts = []
+    list(dicts_to_pydantic(iter(records), scan_limit=1, on_drift=drifts.append))
+    assert [d.index for d in drifts] == [1]
+    assert drifts[0].new_keys == {"u.b"}
+
+    widened = list(dicts_to_pydantic(iter(records), scan_limit=1, widen_on_drift=True))
+    assert widened[1].u.b == 3
+
+
+def test_dicts_to_pydantic_reports_coerced_values():
+    from articuno import dicts_to_pydantic
+
+    records = [{"id": 1}, {"id": "7"}]
+    drifts = []
+    instances = list(dicts_to_pydantic(iter(records), scan_limit=1, on_drift=drifts.append))
+    assert [d.index for d in drifts] == [1]
+    assert drifts[0].errors[0]["type"] == "int_type"
+    assert instances[1].id == 7
+
+    widened = list(dicts_to_pydantic(iter(records), scan_limit=1, widen_on_drift=True))
+    assert widened[1].id == "7"
+
+
+def test_cli_json_cache_and_import_errors(tmp_path, capsys, monkeypatch):
+    import json
+    import articuno.cli as cli
+
+    source = tmp_path / "events.ndjson"
+    source.write_text('{"id": 1}\n')
+    output = tmp_path / "models.py"
+
+    assert cli.main([str(source), "-o", str(output), "-j", "1"]) == 0
+    cache = json.loads((tmp_path / "models.py.articuno-cache").read_text())
+    assert list(cache["files"]) == [str(source.resolve())]
+
+    def missing_dependency(*args, **kwargs):
+        raise ImportError("No module named 'pyarrow'")
+
+    monkeypatch.setattr(cli, "_infer_partition_spec", missing_dependency)
+    assert cli.main([str(source), "-j", "1"]) == 1
+    assert "articuno: error: No module named 'pyarrow'" in capsys.readouterr().err
+
+
+def test_cli_cache_without_output_prints_module(tmp_path, capsys):
+    from articuno.cli import main
+
+    source = tmp_path / "events.ndjson"
+    source.write_text('{"id": 1}\n')
+    cache = tmp_path / "cache.json"
+
+    for _ in range(2):
+        assert main([str(source), "--cache", str(cache), "-j", "1"]) == 0
+        assert "class Events(BaseModel)" in capsys.readouterr().out
+
+
+def test_cli_reinfers_only_changed_files(tmp_path, monkeypatch):
+    import articuno.cli as cli
+
+    first = tmp_path / "first.ndjson"
+    second = tmp_path / "second.ndjson"
+    first.write_text('{"id": 1}\n')
+    second.write_text('{"name": "A"}\n')
+    output = tmp_path / "models.py"
+    args = [str(first), str(second), "-o", str(output), "-j", "1"]
+
+    inferred = []
+    infer = cli._infer_partition_spec
+
+    def recording_infer(partition, **kwargs):
+        inferred.append(partition)
+        return infer(partition, **kwargs)
+
+    monkeypatch.setattr(cli, "_infer_partition_spec", recording_infer)
+    assert cli.main(args) == 0
+    assert sorted(inferred) == [first.resolve(), second.resolve()]
+
+    inferred.clear()
+    second.write_text('{"name": "A", "score": 1.5}\n')
+    assert cli.main(args) == 0
+    assert inferred == [second.resolve()]
+    code = output.read_text()
+    assert "class First(BaseModel)" in code and "score: float" in code